@@ -3,6 +3,7 @@ from contextlib import asynccontextmanager
 from typing import Protocol
 
 from aiobotocore.client import AioBaseClient
+from aiobotocore.config import AioConfig
 from aiobotocore.session import get_session
 from asyncpg.pool import Pool
 from fastapi import APIRouter, FastAPI
@@ -10,7 +11,7 @@ from prometheus_fastapi_instrumentator import Instrumentator
 from scalar_fastapi import get_scalar_api_reference
 
 from .clients.pg import create_db_pool
-from .env import api_prefix, hostname, pool_max_size, protocol, public_port
+from .env import api_prefix, hostname, pool_max_size, pool_min_size, protocol, public_port
 
 
 class State(Protocol):
@@ -22,47 +23,56 @@ class ObjectWithState(Protocol):
     state: State
 
 
+# Shared S3 client config; the default pool of 10 connections throttles concurrent requests
+s3_client_config = AioConfig(
+    max_pool_connections=50,
+    connect_timeout=5,
+    read_timeout=60,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+)
+
+
 # TODO: This currently doesn't use env.py, we should move to using them
 @asynccontextmanager
 async def lifespan(container: FastAPI | ObjectWithState):
-    # INIT POSTGRES #
-    pg_dsn = os.environ.get("PG_DSN")
-
-    pool = await create_db_pool(pg_dsn, max_size=pool_max_size)
+    # Resources already attached to the container are reused rather than recreated
+    state = getattr(container, "state", None)
 
-    if hasattr(container, "state") and not getattr(container.state, "postgres_pool", None):
-        container.state.postgres_pool = pool
+    # INIT POSTGRES #
+    if state is not None and not getattr(state, "postgres_pool", None):
+        pg_dsn = os.environ.get("PG_DSN")
+        state.postgres_pool = await create_db_pool(
+            pg_dsn, min_size=pool_min_size, max_size=pool_max_size
+        )
 
     # INIT S3 #
-    s3_access_key = os.environ.get("S3_ACCESS_KEY")
-    s3_secret_key = os.environ.get("S3_SECRET_KEY")
-    s3_endpoint = os.environ.get("S3_ENDPOINT")
+    if state is not None and not getattr(state, "s3_client", None):
+        s3_access_key = os.environ.get("S3_ACCESS_KEY")
+        s3_secret_key = os.environ.get("S3_SECRET_KEY")
+        s3_endpoint = os.environ.get("S3_ENDPOINT")
 
-    if hasattr(container, "state") and not getattr(container.state, "s3_client", None):
         session = get_session()
-        container.state.s3_client = await session.create_client(
+        state.s3_client = await session.create_client(
             "s3",
             aws_access_key_id=s3_access_key,
             aws_secret_access_key=s3_secret_key,
             endpoint_url=s3_endpoint,
+            config=s3_client_config,
         ).__aenter__()
 
     try:
         yield
     finally:
-        # CLOSE POSTGRES #
-        if hasattr(container, "state") and getattr(container.state, "postgres_pool", None):
-            pool = getattr(container.state, "postgres_pool", None)
-            if pool:
+        if state is not None:
+            # CLOSE POSTGRES #
+            if pool := getattr(state, "postgres_pool", None):
                 await pool.close()
-            container.state.postgres_pool = None
+            state.postgres_pool = None
 
-        # CLOSE S3 #
-        if hasattr(container, "state") and getattr(container.state, "s3_client", None):
-            s3_client = getattr(container.state, "s3_client", None)
-            if s3_client:
+            # CLOSE S3 #
+            if s3_client := getattr(state, "s3_client", None):
                 await s3_client.close()
-            container.state.s3_client = None
+            state.s3_client = None
 
 
 app: FastAPI = FastAPI(
@@ -83,7 +93,18 @@ app: FastAPI = FastAPI(
 )
 
 # Enable metrics
-Instrumentator().instrument(app).expose(app, include_in_schema=False)
+# NOTE: Docs and metrics handlers are excluded and the latency histogram uses coarse
+# buckets to keep per-request overhead and the exported payload small
+Instrumentator(
+    # NOTE: These are regexes matched anywhere in the route path, so they must be anchored
+    # to avoid also excluding routes like `/docs/{doc_id}` or `/users/{user_id}/docs`
+    excluded_handlers=["^/metrics$", "^/swagger", "^/docs$", "^/openapi.json$"],
+    should_group_status_codes=True,
+    should_instrument_requests_inprogress=False,
+).instrument(
+    app,
+    latency_highr_buckets=(0.005, 0.025, 0.1, 0.5, 2.5, 10),
+).expose(app, include_in_schema=False)
 
 
 # Create a new router for the docs
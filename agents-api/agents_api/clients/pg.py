@@ -1,20 +1,66 @@
-import json
+import struct
+from contextlib import suppress
 
 import asyncpg
+import numpy as np
+import orjson
 
-from ..env import pg_dsn
+from ..env import pg_dsn, pg_statement_cache_size, pool_max_inactive_connection_lifetime
+
+# NOTE: All query modules pass constant SQL text to `conn.fetch*`, so asyncpg's
+# per-connection statement cache can skip the Parse/Describe roundtrip on reuse.
+_default_pool_kwargs = {
+    "statement_cache_size": pg_statement_cache_size,
+    "max_cached_statement_lifetime": 0,
+    "max_cacheable_statement_size": 15 * 1024,
+    "max_inactive_connection_lifetime": pool_max_inactive_connection_lifetime,
+}
+
+
+def _encode_jsonb(value) -> bytes:
+    # jsonb binary format: a version byte (1) followed by the json text
+    return b"\x01" + orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _decode_jsonb(data: bytes):
+    return orjson.loads(data[1:])
+
+
+def _encode_vector(value) -> bytes:
+    # pgvector binary format: int16 dim, int16 unused, followed by big-endian float4s
+    vector = np.asarray(value, dtype=">f4")
+    return struct.pack(">HH", vector.shape[0], 0) + vector.tobytes()
+
+
+def _decode_vector(data: bytes) -> list[float]:
+    dim, _ = struct.unpack_from(">HH", data)
+    vector = np.frombuffer(data, dtype=">f4", count=dim, offset=4)
+    # Round-trip through float32's shortest repr so e.g. 0.1 doesn't come back widened
+    return vector.astype(str).astype(float).tolist()
 
 
 async def _init_conn(conn):
     await conn.set_type_codec(
         "jsonb",
-        encoder=json.dumps,
-        decoder=json.loads,
+        encoder=_encode_jsonb,
+        decoder=_decode_jsonb,
         schema="pg_catalog",
+        format="binary",
     )
 
+    # The `vector` type only exists once the pgvector extension has been installed
+    with suppress(ValueError):
+        await conn.set_type_codec(
+            "vector",
+            encoder=_encode_vector,
+            decoder=_decode_vector,
+            format="binary",
+        )
+
 
 async def create_db_pool(dsn: str | None = None, **kwargs):
     return await asyncpg.create_pool(
-        dsn if dsn is not None else pg_dsn, init=_init_conn, **kwargs
+        dsn if dsn is not None else pg_dsn,
+        init=_init_conn,
+        **{**_default_pool_kwargs, **kwargs},
     )
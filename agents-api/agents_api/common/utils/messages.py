@@ -2,6 +2,7 @@ import json
 from typing import cast
 
 from beartype import beartype
+from pydantic_core import to_jsonable_python
 
 from ...autogen.openapi_model import (
     ChatMLImageContentPart,
@@ -18,7 +19,9 @@ def content_to_json(
     elif isinstance(content, list):
         result = content
     elif isinstance(content, dict):
-        result = [{"type": "text", "text": json.dumps(content, indent=4)}]
+        result = [
+            {"type": "text", "text": json.dumps(content, indent=4, default=to_jsonable_python)}
+        ]
 
     return result
 
@@ -0,0 +1,14 @@
+from beartype import beartype as _beartype
+
+from ...env import typecheck
+
+__all__ = ["beartype"]
+
+
+def _passthrough(func):
+    return func
+
+
+# Runtime type checking of query builders is only enabled in debug/testing by default;
+# request payloads are already validated by pydantic at the API boundary
+beartype = _beartype if typecheck else _passthrough
@@ -17,6 +17,7 @@ env: Any = Env()
 # -----
 debug: bool = env.bool("AGENTS_API_DEBUG", default=False)
 testing: bool = env.bool("AGENTS_API_TESTING", default=False)
+typecheck: bool = env.bool("AGENTS_API_TYPECHECK", default=debug or testing)
 sentry_dsn: str = env.str("SENTRY_DSN", default=None)
 
 # App
@@ -62,6 +63,11 @@ summarization_model_name: str = env.str("SUMMARIZATION_MODEL_NAME", default="gpt
 
 query_timeout: float = env.float("QUERY_TIMEOUT", default=90.0)
 pool_max_size: int = env.int("POOL_MAX_SIZE", default=multiprocessing.cpu_count())
+pool_min_size: int = env.int("POOL_MIN_SIZE", default=min(10, pool_max_size))
+pool_max_inactive_connection_lifetime: float = env.float(
+    "POOL_MAX_INACTIVE_CONNECTION_LIFETIME", default=300.0
+)
+pg_statement_cache_size: int = env.int("PG_STATEMENT_CACHE_SIZE", default=1024)
 
 
 # Auth
@@ -159,6 +165,7 @@ environment: dict[str, Any] = {
     "s3_access_key": s3_access_key,
     "s3_secret_key": s3_secret_key,
     "testing": testing,
+    "typecheck": typecheck,
 }
 
 if debug or testing:
@@ -29,14 +29,23 @@ SELECT
     updated_at
 FROM agents
 WHERE developer_id = $1 {metadata_filter_query}
-ORDER BY
-    CASE WHEN $4 = 'created_at' AND $5 = 'asc' THEN created_at END ASC NULLS LAST,
-    CASE WHEN $4 = 'created_at' AND $5 = 'desc' THEN created_at END DESC NULLS LAST,
-    CASE WHEN $4 = 'updated_at' AND $5 = 'asc' THEN updated_at END ASC NULLS LAST,
-    CASE WHEN $4 = 'updated_at' AND $5 = 'desc' THEN updated_at END DESC NULLS LAST
+ORDER BY {sort_by} {direction} NULLS LAST
 LIMIT $2 OFFSET $3;
 """
 
+# Precompute one query per (sort_by, direction, has_metadata_filter) combination so that
+# the sort key is a plain column (index-friendly) and the SQL text stays constant per shape
+_query_table: dict[tuple[str, str, bool], str] = {
+    (sort_by, direction, has_filter): raw_query.format(
+        metadata_filter_query="AND metadata @> $4::jsonb" if has_filter else "",
+        sort_by=sort_by,
+        direction=direction.upper(),
+    )
+    for sort_by in ("created_at", "updated_at")
+    for direction in ("asc", "desc")
+    for has_filter in (False, True)
+}
+
 
 @rewrap_exceptions(common_db_exceptions("agent", ["list"]))
 @wrap_in_class(
@@ -72,18 +81,12 @@ async def list_agents(
     if direction.lower() not in ["asc", "desc"]:
         raise HTTPException(status_code=400, detail="Invalid sort direction")
 
-    # Build metadata filter clause if needed
-
-    agent_query = raw_query.format(
-        metadata_filter_query="AND metadata @> $6::jsonb" if metadata_filter else ""
-    )
+    agent_query = _query_table[sort_by, direction.lower(), bool(metadata_filter)]
 
     params = [
         developer_id,
         limit,
         offset,
-        sort_by,
-        direction,
     ]
 
     if metadata_filter:
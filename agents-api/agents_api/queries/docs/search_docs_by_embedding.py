@@ -1,6 +1,7 @@
 from typing import Any, Literal
 from uuid import UUID
 
+import numpy as np
 from beartype import beartype
 from fastapi import HTTPException
 
@@ -33,7 +34,7 @@ SELECT * FROM search_by_vector(
 async def search_docs_by_embedding(
     *,
     developer_id: UUID,
-    embedding: list[float],
+    embedding: np.ndarray | list[float],
     k: int = 10,
     owners: list[tuple[Literal["user", "agent"], UUID]],
     confidence: int | float = 0.5,
@@ -44,7 +45,7 @@ async def search_docs_by_embedding(
 
     Parameters:
         developer_id (UUID): The ID of the developer.
-        embedding (List[float]): The vector to query.
+        embedding (np.ndarray | list[float]): The vector to query.
         k (int): The number of results to return.
         owners (list[tuple[Literal["user", "agent"], UUID]]): List of (owner_type, owner_id) tuples.
         confidence (float): The confidence threshold for the search.
@@ -56,21 +57,21 @@ async def search_docs_by_embedding(
     if k < 1:
         raise HTTPException(status_code=400, detail="k must be >= 1")
 
-    if not embedding:
+    if len(embedding) == 0:
         raise HTTPException(status_code=400, detail="Empty embedding provided")
 
-    # Convert embedding to a string
-    embedding_str = f"[{', '.join(map(str, embedding))}]"
+    # Keep the embedding as a single float32 buffer for the binary vector codec
+    embedding = np.asarray(embedding, dtype=np.float32)
 
     # Extract owner types and IDs
     owner_types: list[str] = [owner[0] for owner in owners]
-    owner_ids: list[str] = [str(owner[1]) for owner in owners]
+    owner_ids: list[UUID] = [owner[1] for owner in owners]
 
     return (
         search_docs_by_embedding_query,
         [
             developer_id,
-            embedding_str,
+            embedding,
             owner_types,
             owner_ids,
             k,
@@ -75,9 +75,6 @@ async def search_docs_hybrid(
     if not embedding:
         raise HTTPException(status_code=400, detail="Empty embedding provided")
 
-    # Convert query_embedding to a string
-    embedding_str = f"[{', '.join(map(str, embedding))}]"
-
     # Extract owner types and IDs
     owner_types: list[str] = [owner[0] for owner in owners]
     owner_ids: list[str] = [str(owner[1]) for owner in owners]
@@ -90,7 +87,7 @@ async def search_docs_hybrid(
         [
             developer_id,
             text_query,
-            embedding_str,
+            embedding,
             owner_types,
             owner_ids,
             k,
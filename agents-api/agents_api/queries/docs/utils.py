@@ -7,16 +7,15 @@ def transform_to_doc_reference(d: dict) -> dict:
     index = d.pop("index")
 
     # Convert embedding array string to list of floats if present
-    if d["embedding"] is not None:
+    # (vectors are already decoded by the binary codec registered on the pool)
+    embedding = d["embedding"]
+    if isinstance(embedding, str):
         try:
-            embedding = json.loads(d["embedding"])
+            embedding = json.loads(embedding)
         except Exception as e:
             msg = f"Error evaluating embeddings: {e}"
             raise ValueError(msg)
 
-    else:
-        embedding = None
-
     owner = {
         "id": d.pop("owner_id"),
         "role": d.pop("owner_type"),
@@ -1,8 +1,14 @@
+from datetime import timedelta
+from functools import lru_cache
 from typing import Literal
 from uuid import UUID
 
+import asyncpg
+import orjson
 from beartype import beartype
+from fastapi import HTTPException
 from litellm.utils import _select_tokenizer as select_tokenizer
+from pydantic_core import to_jsonable_python
 from uuid_extensions import uuid7
 
 from ...autogen.openapi_model import (
@@ -11,7 +17,7 @@ from ...autogen.openapi_model import (
     ResourceCreatedResponse,
 )
 from ...common.utils.datetime import utcnow
-from ...common.utils.db_exceptions import common_db_exceptions
+from ...common.utils.db_exceptions import common_db_exceptions, partialclass
 from ...common.utils.messages import content_to_json
 from ...metrics.counters import increase_counter
 from ..utils import pg_query, rewrap_exceptions, wrap_in_class
@@ -25,6 +31,8 @@ SELECT EXISTS (
 """
 
 # Define the raw SQL query for creating entries
+# NOTE: `content` and `tool_calls` are jsonb[] per entry, so each entry's array is sent
+# as a single json text value and expanded back into a jsonb[] here
 entry_query = """
 INSERT INTO entries (
     session_id,
@@ -41,7 +49,55 @@ INSERT INTO entries (
     tokenizer,
     created_at,
     timestamp
-) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14)
+)
+SELECT
+    -- NULL (and hence a not-null violation) unless the session belongs to the developer
+    (SELECT session_id FROM sessions WHERE session_id = $1 AND developer_id = $2),
+    e.entry_id,
+    e.source,
+    e.role::chat_role,
+    e.event_type,
+    e.name,
+    ARRAY(SELECT jsonb_array_elements(e.content::jsonb)),
+    e.tool_call_id,
+    CASE
+        WHEN e.tool_calls IS NULL THEN NULL
+        ELSE ARRAY(SELECT jsonb_array_elements(e.tool_calls::jsonb))
+    END,
+    e.model,
+    e.token_count,
+    e.tokenizer,
+    e.created_at,
+    e.timestamp
+FROM UNNEST(
+    $3::uuid[], -- entry_id
+    $4::text[], -- source
+    $5::text[], -- role
+    $6::text[], -- event_type
+    $7::text[], -- name
+    $8::text[], -- content
+    $9::text[], -- tool_call_id
+    $10::text[], -- tool_calls
+    $11::text[], -- model
+    $12::integer[], -- token_count
+    $13::text[], -- tokenizer
+    $14::timestamptz[], -- created_at
+    $15::timestamptz[] -- timestamp
+) AS e (
+    entry_id,
+    source,
+    role,
+    event_type,
+    name,
+    content,
+    tool_call_id,
+    tool_calls,
+    model,
+    token_count,
+    tokenizer,
+    created_at,
+    timestamp
+)
 RETURNING *;
 """
 
@@ -52,12 +108,36 @@ INSERT INTO entry_relations (
     head,
     relation,
     tail
-) VALUES ($1, $2, $3, $4)
+)
+SELECT
+    $1,
+    r.head,
+    r.relation,
+    r.tail
+FROM UNNEST(
+    $2::uuid[], -- head
+    $3::text[], -- relation
+    $4::uuid[] -- tail
+) AS r(head, relation, tail)
 RETURNING *;
 """
 
 
-@rewrap_exceptions(common_db_exceptions("entry", ["create"]))
+@lru_cache(maxsize=256)
+def get_tokenizer_type(model: str | None) -> str:
+    """Returns the tokenizer type for a model (memoized since it only depends on the name)"""
+    return select_tokenizer(model)["type"]
+
+
+@rewrap_exceptions({
+    lambda e: isinstance(e, asyncpg.NotNullViolationError)
+    and e.column_name == "session_id": partialclass(
+        HTTPException,
+        status_code=404,
+        detail="Session not found",
+    ),
+    **common_db_exceptions("entry", ["create"]),
+})
 @wrap_in_class(
     ResourceCreatedResponse,
     transform=lambda d: {
@@ -74,7 +154,7 @@ async def create_entries(
     developer_id: UUID,
     session_id: UUID,
     data: list[CreateEntryRequest],
-) -> list[tuple[str, list, Literal["fetch", "fetchmany", "fetchrow"]]]:
+) -> tuple[str, list, Literal["fetch", "fetchmany", "fetchrow"]]:
     """
     Create entries in a session.
 
@@ -84,43 +164,61 @@ async def create_entries(
         data (list[CreateEntryRequest]): The list of entries to create.
 
     Returns:
-        list[tuple[str, list, Literal["fetch", "fetchmany", "fetchrow"]]]: SQL query and parameters for creating the entries.
+        tuple[str, list, Literal["fetch", "fetchmany", "fetchrow"]]: SQL query and parameters for creating the entries.
     """
     # Convert the data to a list of dictionaries
-    data_dicts = [item.model_dump(mode="json") for item in data]
+    data_dicts = [item.model_dump() for item in data]
 
+    # Offset each entry by a microsecond so the batch stays ordered by created_at;
+    # back-to-back utcnow() calls often return the same value
+    now = utcnow()
+    timestamps = [now + timedelta(microseconds=i) for i in range(len(data_dicts))]
+
+    # Transpose the entries into one array per column for a single UNNEST insert.
+    # Entries are dumped in python mode, so values orjson can't (or, for datetimes,
+    # shouldn't) serialize natively fall back to pydantic's JSON conversion
     params = [
+        session_id,  # $1
+        developer_id,  # $2
+        [item.pop("id", None) or uuid7() for item in data_dicts],  # $3
+        [item.get("source") for item in data_dicts],  # $4
+        [item.get("role") for item in data_dicts],  # $5
+        [item.get("event_type") or "message.create" for item in data_dicts],  # $6
+        [item.get("name") for item in data_dicts],  # $7
+        [
+            orjson.dumps(
+                content_to_json(item.get("content") or {}),
+                default=to_jsonable_python,
+                option=orjson.OPT_PASSTHROUGH_DATETIME,
+            ).decode()
+            for item in data_dicts
+        ],  # $8
+        [item.get("tool_call_id") for item in data_dicts],  # $9
         [
-            session_id,  # $1
-            item.pop("id", None) or uuid7(),  # $2
-            item.get("source"),  # $3
-            item.get("role"),  # $4
-            item.get("event_type") or "message.create",  # $5
-            item.get("name"),  # $6
-            content_to_json(item.get("content") or {}),  # $7
-            item.get("tool_call_id"),  # $8
-            item.get("tool_calls"),  # $9
-            item.get("model"),  # $10
-            item.get("token_count"),  # $11
-            select_tokenizer(item.get("model"))["type"],  # $12
-            item.get("created_at") or utcnow(),  # $13
-            utcnow(),  # $14
-        ]
-        for item in data_dicts
+            orjson.dumps(
+                item["tool_calls"],
+                default=to_jsonable_python,
+                option=orjson.OPT_PASSTHROUGH_DATETIME,
+            ).decode()
+            if item.get("tool_calls") is not None
+            else None
+            for item in data_dicts
+        ],  # $10
+        [item.get("model") for item in data_dicts],  # $11
+        [item.get("token_count") for item in data_dicts],  # $12
+        [get_tokenizer_type(item.get("model")) for item in data_dicts],  # $13
+        [
+            item.get("created_at") or timestamp
+            for item, timestamp in zip(data_dicts, timestamps)
+        ],  # $14
+        timestamps,  # $15
     ]
 
-    return [
-        (
-            session_exists_query,
-            [session_id, developer_id],
-            "fetchrow",
-        ),
-        (
-            entry_query,
-            params,
-            "fetchmany",
-        ),
-    ]
+    return (
+        entry_query,
+        params,
+        "fetch",
+    )
 
 
 @rewrap_exceptions(common_db_exceptions("entry_relation", ["create"]))
@@ -146,21 +244,14 @@ async def add_entry_relations(
         list[tuple[str, list, Literal["fetch", "fetchmany", "fetchrow"]]]: SQL query and parameters for adding the relations.
     """
     # Convert the data to a list of dictionaries
-    data_dicts = [item.model_dump(mode="json") for item in data]
+    data_dicts = [item.model_dump() for item in data]
 
-    # Prepare the parameters for the query
-    # $1
-    # $2
-    # $3
-    # $4
+    # Prepare the parameters for the query, one array per column
     params = [
-        [
-            session_id,  # $1
-            item.get("head"),  # $2
-            item.get("relation"),  # $3
-            item.get("tail"),  # $4
-        ]
-        for item in data_dicts
+        session_id,  # $1
+        [item.get("head") for item in data_dicts],  # $2
+        [item.get("relation") for item in data_dicts],  # $3
+        [item.get("tail") for item in data_dicts],  # $4
     ]
 
     return [
@@ -172,6 +263,6 @@ async def add_entry_relations(
         (
             entry_relation_query,
             params,
-            "fetchmany",
+            "fetch",
         ),
     ]
@@ -57,7 +57,15 @@ INSERT INTO session_lookup (
     participant_type,
     participant_id
 )
-VALUES ($1, $2, $3, $4)
+SELECT
+    $1,
+    $2,
+    p.participant_type::participant_type,
+    p.participant_id
+FROM UNNEST(
+    $3::text[], -- participant_type
+    $4::uuid[] -- participant_id
+) AS p(participant_type, participant_id)
 ON CONFLICT (developer_id, session_id, participant_type, participant_id) DO NOTHING;
 """
 
@@ -104,10 +112,6 @@ async def create_or_update_session(
             detail="Only one of 'agent' or 'agents' should be provided",
         )
 
-    # Prepare participant arrays for lookup query
-    participant_types = ["user"] * len(users) + ["agent"] * len(agents)
-    participant_ids = [str(u) for u in users] + [str(a) for a in agents]
-
     # Prepare session parameters
     session_params = [
         developer_id,  # $1
@@ -122,12 +126,15 @@ async def create_or_update_session(
         data.recall_options.model_dump() if data.recall_options else {},  # $10
     ]
 
-    # Prepare lookup parameters
-    lookup_params = []
-    for participant_type, participant_id in zip(participant_types, participant_ids):
-        lookup_params.append([developer_id, session_id, participant_type, participant_id])
+    # Prepare lookup parameters, one array per column
+    lookup_params = [
+        developer_id,  # $1
+        session_id,  # $2
+        ["user"] * len(users) + ["agent"] * len(agents),  # $3
+        [*users, *agents],  # $4
+    ]
 
     return [
         (session_query, session_params, "fetch"),
-        (lookup_query, lookup_params, "fetchmany"),
+        (lookup_query, lookup_params, "fetch"),
     ]
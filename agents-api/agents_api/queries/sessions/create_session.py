@@ -45,7 +45,15 @@ INSERT INTO session_lookup (
     participant_type,
     participant_id
 )
-VALUES ($1, $2, $3, $4);
+SELECT
+    $1,
+    $2,
+    p.participant_type::participant_type,
+    p.participant_id
+FROM UNNEST(
+    $3::text[], -- participant_type
+    $4::uuid[] -- participant_id
+) AS p(participant_type, participant_id);
 """
 
 
@@ -96,10 +104,6 @@ async def create_session(
             detail="Only one of 'agent' or 'agents' should be provided",
         )
 
-    # Prepare participant arrays for lookup query
-    participant_types = ["user"] * len(users) + ["agent"] * len(agents)
-    participant_ids = [str(u) for u in users] + [str(a) for a in agents]
-
     # Prepare session parameters
     session_params = [
         developer_id,  # $1
@@ -114,12 +118,15 @@ async def create_session(
         data.recall_options.model_dump() if data.recall_options else {},  # $10
     ]
 
-    # Prepare lookup parameters as a list of parameter lists
-    lookup_params = []
-    for ptype, pid in zip(participant_types, participant_ids):
-        lookup_params.append([developer_id, session_id, ptype, pid])
+    # Prepare lookup parameters, one array per column
+    lookup_params = [
+        developer_id,  # $1
+        session_id,  # $2
+        ["user"] * len(users) + ["agent"] * len(agents),  # $3
+        [*users, *agents],  # $4
+    ]
 
     return [
         (session_query, session_params, "fetch"),
-        (lookup_query, lookup_params, "fetchmany"),
+        (lookup_query, lookup_params, "fetch"),
     ]
@@ -4,12 +4,17 @@ in the TimescaleDB database. This includes operations for:
 
 - Creating new users
 - Updating existing users
+- Creating or updating users in bulk
 - Retrieving user details
 - Listing users with filtering and pagination
 - Deleting users
 """
 
-from .create_or_update_user import create_or_update_user
+from .create_or_update_user import (
+    bulk_create_or_update_users,
+    bulk_import_users,
+    create_or_update_user,
+)
 from .create_user import create_user
 from .delete_user import delete_user
 from .get_user import get_user
@@ -18,6 +23,8 @@ from .patch_user import patch_user
 from .update_user import update_user
 
 __all__ = [
+    "bulk_create_or_update_users",
+    "bulk_import_users",
     "create_or_update_user",
     "create_user",
     "delete_user",
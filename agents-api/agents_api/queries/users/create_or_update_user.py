@@ -1,14 +1,18 @@
 from uuid import UUID
 
-from beartype import beartype
+import asyncpg
+from asyncpg import Record
+from fastapi import HTTPException
 
-from ...autogen.openapi_model import CreateOrUpdateUserRequest, User
+from ...autogen.openapi_model import CreateOrUpdateUserRequest, ResourceCreatedResponse, User
 from ...common.utils.db_exceptions import common_db_exceptions
+from ...common.utils.typecheck import beartype
+from ...env import query_timeout
 from ...metrics.counters import increase_counter
-from ..utils import pg_query, rewrap_exceptions, wrap_in_class
+from ..utils import pg_query, pg_transaction, rewrap_exceptions, wrap_in_class
 
 # Define the raw SQL query for creating or updating a user
-user_query = """
+raw_user_query = """
 INSERT INTO users (
     developer_id,
     user_id,
@@ -27,25 +31,139 @@ ON CONFLICT (developer_id, user_id) DO UPDATE SET
     name = EXCLUDED.name,
     about = EXCLUDED.about,
     metadata = EXCLUDED.metadata
-RETURNING *;
+RETURNING {returning_columns};
 """
 
+user_query = raw_user_query.format(
+    returning_columns="user_id, name, about, metadata, created_at, updated_at"
+)
+
+# Only the columns needed for a ResourceCreatedResponse, so metadata isn't sent back
+user_query_minimal = raw_user_query.format(returning_columns="user_id, created_at")
+
+
+# Bulk upserts skip waiting for the WAL flush on commit; the setting only lasts for the
+# transaction pg_query runs the batch in
+synchronous_commit_off_query = "SET LOCAL synchronous_commit = off;"
+
+# Define the raw SQL query for creating or updating many users at once
+bulk_user_query = """
+INSERT INTO users (
+    developer_id,
+    user_id,
+    name,
+    about,
+    metadata
+)
+SELECT
+    $1, -- developer_id
+    u.user_id,
+    u.name,
+    u.about,
+    u.metadata
+FROM UNNEST(
+    $2::uuid[], -- user_id
+    $3::text[], -- name
+    $4::text[], -- about
+    $5::jsonb[] -- metadata
+) AS u(user_id, name, about, metadata)
+ON CONFLICT (developer_id, user_id) DO UPDATE SET
+    name = EXCLUDED.name,
+    about = EXCLUDED.about,
+    metadata = EXCLUDED.metadata
+RETURNING
+    user_id,
+    name,
+    about,
+    metadata,
+    created_at,
+    updated_at;
+"""
+
+
+# Staging table for COPY-based user imports; dropped when the import transaction commits
+import_table_query = """
+CREATE TEMPORARY TABLE users_import (LIKE users INCLUDING DEFAULTS) ON COMMIT DROP;
+"""
+
+import_table_columns = ["developer_id", "user_id", "name", "about", "metadata"]
+
+# Define the raw SQL query for upserting the staged users
+import_user_query = """
+INSERT INTO users (
+    developer_id,
+    user_id,
+    name,
+    about,
+    metadata
+)
+SELECT
+    developer_id,
+    user_id,
+    name,
+    about,
+    metadata
+FROM users_import
+ON CONFLICT (developer_id, user_id) DO UPDATE SET
+    name = EXCLUDED.name,
+    about = EXCLUDED.about,
+    metadata = EXCLUDED.metadata
+RETURNING
+    user_id,
+    name,
+    about,
+    metadata,
+    created_at,
+    updated_at;
+"""
+
+
+def _transform_user(d: dict) -> dict:
+    return {**d, "id": d["user_id"]}
+
+
+def _check_unique_user_ids(data: list[tuple[UUID, CreateOrUpdateUserRequest]]) -> None:
+    # A single upsert cannot touch the same row twice, so reject repeated ids up front
+    user_ids = [user_id for user_id, _ in data]
+
+    if len(set(user_ids)) != len(user_ids):
+        raise HTTPException(status_code=400, detail="Duplicate user ids in batch")
+
+
+def _user_params(developer_id: UUID, user_id: UUID, data: CreateOrUpdateUserRequest) -> tuple:
+    return (
+        developer_id,  # $1
+        user_id,  # $2
+        data.name,  # $3
+        data.about,  # $4
+        data.metadata or {},  # $5
+    )
+
+
+def _user_or_created_response(**d) -> User | ResourceCreatedResponse:
+    # The minimal query only returns the id and creation time
+    if "updated_at" not in d:
+        return ResourceCreatedResponse(id=d["id"], created_at=d["created_at"])
+
+    return User(**d)
+
 
 @rewrap_exceptions(common_db_exceptions("user", ["create_or_update"]))
 @wrap_in_class(
-    User,
+    _user_or_created_response,
     one=True,
-    transform=lambda d: {
-        **d,
-        "id": d["user_id"],
-    },
+    transform=_transform_user,
 )
 @increase_counter("create_or_update_user")
 @pg_query
 @beartype
-async def create_or_update_user(
-    *, developer_id: UUID, user_id: UUID, data: CreateOrUpdateUserRequest
-) -> tuple[str, list]:
+def create_or_update_user(
+    *,
+    developer_id: UUID,
+    user_id: UUID,
+    data: CreateOrUpdateUserRequest,
+    return_full: bool = True,
+) -> tuple[str, tuple]:
     """
     Constructs an SQL query to create or update a user.
 
@@ -53,22 +171,98 @@ async def create_or_update_user(
         developer_id (UUID): The UUID of the developer.
         user_id (UUID): The UUID of the user.
         data (CreateOrUpdateUserRequest): The user data to insert or update.
+        return_full (bool): Whether to return the full user or only its id and
+            creation time.
 
     Returns:
-        tuple[str, list]: SQL query and parameters.
+        tuple[str, tuple]: SQL query and parameters.
 
     Raises:
         HTTPException: If developer doesn't exist (404) or on unique constraint violation (409)
     """
+    return (
+        user_query if return_full else user_query_minimal,
+        _user_params(developer_id, user_id, data),
+    )
+
+
+@rewrap_exceptions(common_db_exceptions("user", ["create_or_update"]))
+@wrap_in_class(
+    User,
+    transform=_transform_user,
+)
+@increase_counter("bulk_create_or_update_users")
+@pg_query
+@beartype
+def bulk_create_or_update_users(
+    *, developer_id: UUID, data: list[tuple[UUID, CreateOrUpdateUserRequest]]
+) -> list[tuple[str, list]]:
+    """
+    Constructs the SQL queries to create or update many users in one statement.
+
+    Args:
+        developer_id (UUID): The UUID of the developer.
+        data (list[tuple[UUID, CreateOrUpdateUserRequest]]): (user_id, user data) pairs.
+
+    Returns:
+        list[tuple[str, list]]: SQL queries and their parameters.
+    """
+    _check_unique_user_ids(data)
+
     params = [
         developer_id,  # $1
-        user_id,  # $2
-        data.name,  # $3
-        data.about,  # $4
-        data.metadata or {},  # $5
+        [user_id for user_id, _ in data],  # $2
+        [user.name for _, user in data],  # $3
+        [user.about for _, user in data],  # $4
+        [user.metadata or {} for _, user in data],  # $5
     ]
 
-    return (
-        user_query,
-        params,
-    )
+    return [
+        (synchronous_commit_off_query, []),
+        (bulk_user_query, params),
+    ]
+
+
+@rewrap_exceptions(common_db_exceptions("user", ["create_or_update"]))
+@wrap_in_class(
+    User,
+    transform=_transform_user,
+)
+@increase_counter("bulk_import_users")
+@beartype
+async def bulk_import_users(
+    *,
+    developer_id: UUID,
+    data: list[tuple[UUID, CreateOrUpdateUserRequest]],
+    connection_pool: asyncpg.Pool | None = None,
+) -> list[Record]:
+    """
+    Creates or updates a large number of users by COPYing them into a staging table
+    and upserting from there. Prefer `bulk_create_or_update_users` for small batches.
+
+    Args:
+        developer_id (UUID): The UUID of the developer.
+        data (list[tuple[UUID, CreateOrUpdateUserRequest]]): (user_id, user data) pairs.
+        connection_pool (asyncpg.Pool | None): The pool to use, defaults to the app's pool.
+
+    Returns:
+        list[Record]: The created or updated users.
+    """
+    _check_unique_user_ids(data)
+
+    records = [
+        (developer_id, user_id, user.name, user.about, user.metadata or {})
+        for user_id, user in data
+    ]
+
+    # COPY has no place in a `pg_query` batch, so the transaction is managed here
+    async with pg_transaction(connection_pool) as conn:
+        await conn.execute(import_table_query, timeout=query_timeout)
+        await conn.copy_records_to_table(
+            "users_import",
+            records=records,
+            columns=import_table_columns,
+            timeout=query_timeout,
+        )
+
+        return await conn.fetch(import_user_query, timeout=query_timeout)
@@ -1,28 +1,16 @@
 from uuid import UUID
 
-from beartype import beartype
-
 from ...autogen.openapi_model import PatchUserRequest, ResourceUpdatedResponse
 from ...common.utils.db_exceptions import common_db_exceptions
+from ...common.utils.typecheck import beartype
 from ...metrics.counters import increase_counter
 from ..utils import pg_query, rewrap_exceptions, wrap_in_class
 
 # Define the raw SQL query outside the function
-user_query = """
+raw_query = """
 UPDATE users
 SET
-    name = CASE
-        WHEN $3::text IS NOT NULL THEN $3 -- name
-        ELSE name
-    END,
-    about = CASE
-        WHEN $4::text IS NOT NULL THEN $4 -- about
-        ELSE about
-    END,
-    metadata = CASE
-        WHEN $5::jsonb IS NOT NULL THEN metadata || $5 -- metadata
-        ELSE metadata
-    END
+    {set_clauses}
 WHERE developer_id = $1
 AND user_id = $2
 RETURNING
@@ -35,18 +23,47 @@ RETURNING
     updated_at; -- updated_at
 """
 
+# SET clause for each patchable field, in parameter order
+_set_clauses: tuple[tuple[str, str], ...] = (
+    ("name", "name = ${}"),
+    ("about", "about = ${}"),
+    ("metadata", "metadata = metadata || ${}::jsonb"),
+)
+
+
+def _build_query(fields: tuple[bool, ...]) -> str:
+    clauses = [
+        clause.format(index)
+        for index, (_, clause) in enumerate(
+            (field for field, present in zip(_set_clauses, fields) if present), start=3
+        )
+    ]
+
+    # An empty patch still touches the row so that updated_at is bumped
+    return raw_query.format(set_clauses=",\n    ".join(clauses) or "name = name")
+
+
+# Precompute one query per combination of fields present in the patch, so each query
+# only updates the columns it was given and the SQL text stays constant per shape
+_query_table: dict[tuple[bool, ...], str] = {
+    (has_name, has_about, has_metadata): _build_query((has_name, has_about, has_metadata))
+    for has_name in (False, True)
+    for has_about in (False, True)
+    for has_metadata in (False, True)
+}
+
 
 @rewrap_exceptions(common_db_exceptions("user", ["patch"]))
 @wrap_in_class(ResourceUpdatedResponse, one=True)
 @increase_counter("patch_user")
 @pg_query
 @beartype
-async def patch_user(
+def patch_user(
     *, developer_id: UUID, user_id: UUID, data: PatchUserRequest
-) -> tuple[str, list]:
+) -> tuple[str, tuple]:
     """
     Constructs an optimized SQL query for partial user updates.
-    Uses primary key for efficient update and jsonb_merge for metadata.
+    Only the fields set on the request are updated, and metadata is merged.
 
     Args:
         developer_id (UUID): The developer's UUID
@@ -54,15 +71,21 @@ async def patch_user(
         data (PatchUserRequest): Partial update data
 
     Returns:
-        tuple[str, list]: SQL query and parameters
+        tuple[str, tuple]: SQL query and parameters
     """
-    params = [
+    # name and about default to "", so only fields explicitly set on the request are patched
+    values = [
+        getattr(data, field) if field in data.model_fields_set else None
+        for field, _ in _set_clauses
+    ]
+    user_query = _query_table[tuple(value is not None for value in values)]
+
+    params = (
         developer_id,  # $1
         user_id,  # $2
-        data.name,  # $3. Will be NULL if not provided
-        data.about,  # $4. Will be NULL if not provided
-        data.metadata,  # $5. Will be NULL if not provided
-    ]
+        # $3 onwards, only the fields present in the patch
+        *(value for value in values if value is not None),
+    )
 
     return (
         user_query,
@@ -2,7 +2,8 @@ import concurrent.futures
 import inspect
 import socket
 import time
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from contextlib import asynccontextmanager
 from functools import wraps
 from typing import (
     Any,
@@ -38,13 +39,13 @@ def generate_canonical_name() -> str:
 
 class AsyncPGFetchArgs(TypedDict):
     query: str
-    args: list[Any]
+    args: Sequence[Any]
     timeout: NotRequired[float | None]
 
 
 type SQLQuery = str
 type FetchMethod = Literal["fetch", "fetchmany", "fetchrow"]
-type PGQueryArgs = tuple[SQLQuery, list[Any]] | tuple[SQLQuery, list[Any], FetchMethod]
+type PGQueryArgs = tuple[SQLQuery, Sequence[Any]] | tuple[SQLQuery, Sequence[Any], FetchMethod]
 type PreparedPGQueryArgs = tuple[FetchMethod, AsyncPGFetchArgs]
 type BatchedPreparedPGQueryArgs = list[PreparedPGQueryArgs]
 
@@ -63,6 +64,12 @@ def prepare_pg_query_args(
                     "fetch",
                     AsyncPGFetchArgs(query=query, args=variables, timeout=query_timeout),
                 ))
+            # A single-row batch doesn't need executemany, so run it as a plain fetch
+            case (query, [list() | tuple() as variables], "fetchmany"):
+                batch.append((
+                    "fetch",
+                    AsyncPGFetchArgs(query=query, args=variables, timeout=query_timeout),
+                ))
             case (query, variables, "fetchmany"):
                 batch.append((
                     "fetchmany",
@@ -80,6 +87,29 @@ def prepare_pg_query_args(
     return batch
 
 
+@asynccontextmanager
+async def pg_transaction(
+    connection_pool: asyncpg.Pool | None = None,
+) -> AsyncIterator[asyncpg.Connection]:
+    """
+    Acquires a connection from the given pool (or the app's pool) and runs the body in a
+    transaction on it. Connection errors are rewrapped as 429s.
+    """
+    pool = (
+        connection_pool
+        if connection_pool is not None
+        else cast(asyncpg.Pool, getattr(app.state, "postgres_pool", None))
+    )
+
+    try:
+        async with pool.acquire() as conn, conn.transaction():
+            yield conn
+
+    except socket.gaierror as e:
+        exc = HTTPException(status_code=429, detail="Resource busy. Please try again later.")
+        raise exc from e
+
+
 @beartype
 def pg_query(
     func: Callable[P, PGQueryArgs | list[PGQueryArgs]] | None = None,
@@ -107,20 +137,18 @@ def pg_query(
             connection_pool: asyncpg.Pool | None = None,
             **kwargs: P.kwargs,
         ) -> list[Record]:
-            query_args = await func(*args, **kwargs)
+            # Builders may be plain functions, since most only do CPU work
+            query_args = func(*args, **kwargs)
+            if inspect.isawaitable(query_args):
+                query_args = await query_args
+
             batch = prepare_pg_query_args(query_args)
 
             not only_on_error and debug and pprint(batch)
 
             # Run the query
-            pool = (
-                connection_pool
-                if connection_pool is not None
-                else cast(asyncpg.Pool, getattr(app.state, "postgres_pool", None))
-            )
-
             try:
-                async with pool.acquire() as conn, conn.transaction():
+                async with pg_transaction(connection_pool) as conn:
                     start = timeit and time.perf_counter()
                     all_results = []
 
@@ -156,17 +184,6 @@ def pg_query(
                     pprint(batch)
 
                 debug and print(repr(e))
-                connection_error = isinstance(
-                    e,
-                    (socket.gaierror),
-                )
-
-                if connection_error:
-                    exc = HTTPException(
-                        status_code=429, detail="Resource busy. Please try again later."
-                    )
-                    raise exc from e
-
                 raise
 
             # Return results from specified index
@@ -193,17 +210,18 @@ def wrap_in_class(
     transform: Callable[[dict], dict] | None = None,
 ) -> Callable[..., Callable[..., ModelT | list[ModelT]]]:
     def _return_data(rec: list[Record]):
-        data = [dict(r.items()) for r in rec]
+        # Records are copied into dicts since transforms may mutate them
+        data = [dict(r) for r in rec]
 
-        nonlocal transform
-        transform = transform or (lambda x: x)
+        if transform is not None:
+            data = [transform(item) for item in data]
 
         if one:
             assert len(data) == 1, f"Expected one result, got {len(data)}"
-            obj: ModelT = cls(**transform(data[0]))
+            obj: ModelT = cls(**data[0])
             return obj
 
-        objs: list[ModelT] = [cls(**item) for item in map(transform, data)]
+        objs: list[ModelT] = [cls(**item) for item in data]
         return objs
 
     def decorator(
@@ -234,16 +252,18 @@ def rewrap_exceptions(
     ],
     /,
 ) -> Callable[..., Callable[P, T | Awaitable[T]]]:
-    def _check_error(error):
-        nonlocal mapping
+    # Resolve which checks and transforms are exception types once, at decoration time
+    handlers = tuple(
+        (check, isinstance(check, type), transform, isinstance(transform, type))
+        for check, transform in mapping.items()
+    )
 
-        for check, transform in mapping.items():
-            should_catch = isinstance(error, check) if isinstance(check, type) else check(error)
+    def _check_error(error):
+        for check, check_is_type, transform, transform_is_type in handlers:
+            should_catch = isinstance(error, check) if check_is_type else check(error)
 
             if should_catch:
-                new_error = (
-                    transform(str(error)) if isinstance(transform, type) else transform(error)
-                )
+                new_error = transform(str(error)) if transform_is_type else transform(error)
 
                 setattr(new_error, "__cause__", error)
 
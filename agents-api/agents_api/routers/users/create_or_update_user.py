@@ -18,10 +18,9 @@ async def create_or_update_user(
     user_id: UUID,
     data: CreateOrUpdateUserRequest,
 ) -> ResourceCreatedResponse:
-    user = await create_or_update_user_query(
+    return await create_or_update_user_query(
         developer_id=x_developer_id,
         user_id=user_id,
         data=data,
+        return_full=False,
     )
-
-    return ResourceCreatedResponse(id=user.id, created_at=user.created_at, jobs=[])
@@ -177,7 +177,7 @@ async def test_doc_with_embedding(dsn=pg_dsn, developer=test_developer, doc=test
         developer.id,
         doc.id,
         doc.content[0] if isinstance(doc.content, list) else doc.content,
-        f"[{', '.join([str(x) for x in [1.0] * 1024])}]",
+        [1.0] * 1024,
     )
 
     # Insert embedding with confidence 0 with respect to unit vector
@@ -189,7 +189,7 @@ async def test_doc_with_embedding(dsn=pg_dsn, developer=test_developer, doc=test
         developer.id,
         doc.id,
         "Test content 1",
-        f"[{', '.join([str(x) for x in embedding_with_confidence_0])}]",
+        embedding_with_confidence_0,
     )
 
     # Insert embedding with confidence 0.5 with respect to unit vector
@@ -201,7 +201,7 @@ async def test_doc_with_embedding(dsn=pg_dsn, developer=test_developer, doc=test
         developer.id,
         doc.id,
         "Test content 2",
-        f"[{', '.join([str(x) for x in embedding_with_confidence_05])}]",
+        embedding_with_confidence_05,
     )
 
     # Insert embedding with confidence -0.5 with respect to unit vector
@@ -213,7 +213,7 @@ async def test_doc_with_embedding(dsn=pg_dsn, developer=test_developer, doc=test
         developer.id,
         doc.id,
         "Test content 3",
-        f"[{', '.join([str(x) for x in embedding_with_confidence_05_neg])}]",
+        embedding_with_confidence_05_neg,
     )
 
     # Insert embedding with confidence -1 with respect to unit vector
@@ -225,7 +225,7 @@ async def test_doc_with_embedding(dsn=pg_dsn, developer=test_developer, doc=test
         developer.id,
         doc.id,
         "Test content 4",
-        f"[{', '.join([str(x) for x in embedding_with_confidence_1_neg])}]",
+        embedding_with_confidence_1_neg,
     )
 
     yield await get_doc(developer_id=developer.id, doc_id=doc.id, connection_pool=pool)
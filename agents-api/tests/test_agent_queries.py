@@ -119,6 +119,24 @@ async def _(dsn=pg_dsn, developer_id=test_developer_id):
     assert all(isinstance(agent, Agent) for agent in result)
 
 
+@test("query: list agents sql, sorted and filtered by metadata")
+async def _(dsn=pg_dsn, developer_id=test_developer_id, agent=test_agent):
+    """Test that listing agents honors sort order and metadata filters."""
+
+    pool = await create_db_pool(dsn=dsn)
+    result = await list_agents(
+        developer_id=developer_id,
+        sort_by="updated_at",
+        direction="asc",
+        metadata_filter=agent.metadata,
+        connection_pool=pool,
+    )
+
+    assert isinstance(result, list)
+    assert agent.id in [a.id for a in result]
+    assert [a.updated_at for a in result] == sorted(a.updated_at for a in result)
+
+
 @test("query: patch agent sql")
 async def _(dsn=pg_dsn, developer_id=test_developer_id, agent=test_agent):
     """Test that an agent can be successfully patched."""
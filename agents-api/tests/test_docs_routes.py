@@ -123,6 +123,22 @@ def _(make_request=make_request, user=test_user):
     assert isinstance(docs, list)
 
 
+@test("route: doc routes are not excluded from metrics")
+def _(make_request=make_request, user=test_user):
+    make_request(
+        method="GET",
+        url=f"/users/{user.id}/docs",
+    )
+
+    response = make_request(
+        method="GET",
+        url="/metrics",
+    )
+
+    assert response.status_code == 200
+    assert 'handler="/users/{user_id}/docs"' in response.text
+
+
 @test("route: list agent docs")
 def _(make_request=make_request, agent=test_agent):
     response = make_request(
@@ -7,8 +7,10 @@ from agents_api.autogen.openapi_model import (
     CreateEntryRequest,
     Entry,
     History,
+    Tool,
 )
 from agents_api.clients.pg import create_db_pool
+from agents_api.common.utils.datetime import utcnow
 from agents_api.queries.entries import (
     create_entries,
     delete_entries,
@@ -99,6 +101,72 @@ async def _(dsn=pg_dsn, developer_id=test_developer_id, session=test_session):
     assert result is not None
 
 
+@test("query: list entries sql - batch keeps insertion order")
+async def _(dsn=pg_dsn, developer_id=test_developer_id, session=test_session):
+    """Test that entries created in one batch are listed in the order they were given."""
+
+    pool = await create_db_pool(dsn=dsn)
+    entries = [
+        CreateEntryRequest.from_model_input(
+            model=MODEL,
+            role="user",
+            source="api_request",
+            content=f"test entry content {i}",
+        )
+        for i in range(20)
+    ]
+
+    created = await create_entries(
+        developer_id=developer_id,
+        session_id=session.id,
+        data=entries,
+        connection_pool=pool,
+    )
+
+    result = await list_entries(
+        developer_id=developer_id,
+        session_id=session.id,
+        sort_by="created_at",
+        direction="asc",
+        connection_pool=pool,
+    )
+
+    created_ids = [entry.id for entry in created]
+    assert [entry.id for entry in result if entry.id in created_ids] == created_ids
+
+
+@test("query: create entry sql - api_call tool content")
+async def _(dsn=pg_dsn, developer_id=test_developer_id, session=test_session):
+    """Test that list content holding non-JSON-native values (e.g. urls) can be stored."""
+
+    pool = await create_db_pool(dsn=dsn)
+    tool = Tool(
+        id=uuid7(),
+        created_at=utcnow(),
+        updated_at=utcnow(),
+        name="get_weather",
+        type="api_call",
+        api_call={"method": "GET", "url": "https://example.com/weather"},
+    )
+    test_entry = CreateEntryRequest(
+        role="assistant",
+        source="api_response",
+        content=[tool],
+        tokenizer="character_count",
+        token_count=1,
+    )
+
+    created = await create_entries(
+        developer_id=developer_id,
+        session_id=session.id,
+        data=[test_entry],
+        connection_pool=pool,
+    )
+
+    assert len(created) == 1
+    assert isinstance(created[0], Entry)
+
+
 @test("query: get history sql - session exists")
 async def _(dsn=pg_dsn, developer_id=test_developer_id, session=test_session):
     """Test the retrieval of entry history from the database."""
@@ -9,6 +9,7 @@ from agents_api.autogen.openapi_model import (
     CreateOrUpdateUserRequest,
     CreateUserRequest,
     PatchUserRequest,
+    ResourceCreatedResponse,
     ResourceDeletedResponse,
     ResourceUpdatedResponse,
     UpdateUserRequest,
@@ -16,6 +17,8 @@ from agents_api.autogen.openapi_model import (
 )
 from agents_api.clients.pg import create_db_pool
 from agents_api.queries.users import (
+    bulk_create_or_update_users,
+    bulk_import_users,
     create_or_update_user,
     create_user,
     delete_user,
@@ -24,6 +27,7 @@ from agents_api.queries.users import (
     patch_user,
     update_user,
 )
+from fastapi import HTTPException
 from uuid_extensions import uuid7
 from ward import raises, test
 
@@ -65,6 +69,120 @@ async def _(dsn=pg_dsn, developer_id=test_developer_id):
     )
 
 
+@test("query: create or update user sql, minimal")
+async def _(dsn=pg_dsn, developer_id=test_developer_id):
+    """Test that a user can be created or updated returning only its id and creation time."""
+
+    pool = await create_db_pool(dsn=dsn)
+    user_id = uuid7()
+    result = await create_or_update_user(
+        developer_id=developer_id,
+        user_id=user_id,
+        data=CreateOrUpdateUserRequest(
+            name="test user",
+            about="test user about",
+        ),
+        return_full=False,
+        connection_pool=pool,
+    )
+
+    assert isinstance(result, ResourceCreatedResponse)
+    assert result.id == user_id
+
+
+@test("query: bulk create or update users sql")
+async def _(dsn=pg_dsn, developer_id=test_developer_id, user=test_user):
+    """Test that many users can be created or updated with a single query."""
+
+    pool = await create_db_pool(dsn=dsn)
+    new_user_id = uuid7()
+    result = await bulk_create_or_update_users(
+        developer_id=developer_id,
+        data=[
+            (user.id, CreateOrUpdateUserRequest(name="updated user", about="updated about")),
+            (
+                new_user_id,
+                CreateOrUpdateUserRequest(
+                    name="new user", about="new user about", metadata={"bulk": True}
+                ),
+            ),
+        ],
+        connection_pool=pool,
+    )
+
+    assert isinstance(result, list)
+    assert all(isinstance(u, User) for u in result)
+    assert {u.id for u in result} == {user.id, new_user_id}
+
+    users = {u.id: u for u in result}
+    assert users[user.id].name == "updated user"
+    assert users[new_user_id].metadata == {"bulk": True}
+
+
+@test("query: bulk create or update users sql, duplicate ids")
+async def _(dsn=pg_dsn, developer_id=test_developer_id):
+    """Test that a batch repeating a user id is rejected with a 400."""
+
+    pool = await create_db_pool(dsn=dsn)
+    user_id = uuid7()
+
+    with raises(HTTPException) as exc_info:
+        await bulk_create_or_update_users(
+            developer_id=developer_id,
+            data=[
+                (user_id, CreateOrUpdateUserRequest(name="first user", about="first")),
+                (user_id, CreateOrUpdateUserRequest(name="second user", about="second")),
+            ],
+            connection_pool=pool,
+        )
+
+    assert exc_info.raised.status_code == 400
+
+
+@test("query: bulk import users sql")
+async def _(dsn=pg_dsn, developer_id=test_developer_id, user=test_user):
+    """Test that users can be imported through a COPY into a staging table."""
+
+    pool = await create_db_pool(dsn=dsn)
+    new_user_ids = [uuid7() for _ in range(10)]
+    result = await bulk_import_users(
+        developer_id=developer_id,
+        data=[
+            (user.id, CreateOrUpdateUserRequest(name="imported user", about="imported about")),
+            *[
+                (user_id, CreateOrUpdateUserRequest(name="new user", about="new user about"))
+                for user_id in new_user_ids
+            ],
+        ],
+        connection_pool=pool,
+    )
+
+    assert isinstance(result, list)
+    assert all(isinstance(u, User) for u in result)
+    assert {u.id for u in result} == {user.id, *new_user_ids}
+    assert next(u for u in result if u.id == user.id).name == "imported user"
+
+
+@test("query: bulk import users sql, duplicate ids")
+async def _(dsn=pg_dsn, developer_id=test_developer_id):
+    """Test that an import repeating a user id is rejected with a 400."""
+
+    pool = await create_db_pool(dsn=dsn)
+    user_id = uuid7()
+
+    with raises(HTTPException) as exc_info:
+        await bulk_import_users(
+            developer_id=developer_id,
+            data=[
+                (user_id, CreateOrUpdateUserRequest(name="first user", about="first")),
+                (user_id, CreateOrUpdateUserRequest(name="second user", about="second")),
+            ],
+            connection_pool=pool,
+        )
+
+    assert exc_info.raised.status_code == 400
+
+
 @test("query: update user sql")
 async def _(dsn=pg_dsn, developer_id=test_developer_id, user=test_user):
     """Test that an existing user's information can be successfully updated."""
@@ -152,6 +270,31 @@ async def _(dsn=pg_dsn, developer_id=test_developer_id, user=test_user):
     assert patch_result.updated_at > user.created_at
 
 
+@test("query: patch user sql, without metadata")
+async def _(dsn=pg_dsn, developer_id=test_developer_id, user=test_user):
+    """Test that patching a user without metadata leaves the existing metadata untouched."""
+
+    pool = await create_db_pool(dsn=dsn)
+    await patch_user(
+        developer_id=developer_id,
+        user_id=user.id,
+        data=PatchUserRequest(metadata={"test": "metadata"}),
+        connection_pool=pool,
+    )
+    await patch_user(
+        developer_id=developer_id,
+        user_id=user.id,
+        data=PatchUserRequest(name="patched user"),
+        connection_pool=pool,
+    )
+
+    result = await get_user(developer_id=developer_id, user_id=user.id, connection_pool=pool)
+
+    assert result.name == "patched user"
+    assert result.about == user.about
+    assert result.metadata == {"test": "metadata"}
+
+
 @test("query: delete user sql")
 async def _(dsn=pg_dsn, developer_id=test_developer_id, user=test_user):
     """Test that a user can be successfully deleted."""